@@ -60,7 +60,10 @@ async function loadMenuIfNeeded() {
         </div>
         <h4>${p.name}</h4>
         <p>${p.description || ""}</p>
-        <span class="price">R$ ${p.price.toFixed(2).replace('.', ',')}</span>
+        <span class="price">
+          ${p.effective_price < p.price ? `<s>R$ ${p.price.toFixed(2).replace('.', ',')}</s>` : ""}
+          R$ ${p.effective_price.toFixed(2).replace('.', ',')}
+        </span>
         <button class="btn-add" onclick="adicionarAoCarrinho(${p.id})">
           Adicionar
         </button>
@@ -300,9 +303,9 @@ function initCartPage() {
                 <img src="${API_URL}${item.pizza.image_path}" alt="${item.pizza.name}">
                 <div class="meta">
                     <h4>${item.pizza.name}</h4>
-                    <p>R$ ${item.pizza.price.toFixed(2).replace('.', ',')}</p>
+                    <p>R$ ${(item.subtotal_cents / 100).toFixed(2).replace('.', ',')}</p>
                     <div class="actions">
-                        <p>Quantidade: ${item.quantity}</p> 
+                        <p>Quantidade: ${item.quantity} × R$ ${item.unit_price.toFixed(2).replace('.', ',')}</p> 
                         <button class="btn white remove-item" onclick="removerDoCarrinho(${item.pizza.id})">
                             Remover
                         </button>
@@ -312,6 +315,17 @@ function initCartPage() {
             container.appendChild(div);
         });
 
+        if (data.discount_cents > 0) {
+            const desconto = document.createElement("div");
+            desconto.className = "cart-discount";
+            desconto.style.cssText = "display:flex; justify-content:space-between; padding:12px 0; color:#27ae60;";
+            desconto.innerHTML = `
+                <strong>Desconto (combos)</strong>
+                <span>- R$ ${(data.discount_cents / 100).toFixed(2).replace('.', ',')}</span>
+            `;
+            container.appendChild(desconto);
+        }
+
         totalEl.textContent = "R$ " + data.total.toFixed(2).replace(".", ",");
         updateCartCount(); 
         
@@ -377,6 +391,7 @@ async function abrirModalCheckout() {
             }
             checkoutData.items = data.items;
             checkoutData.total = data.total;
+            checkoutData.discount_cents = data.discount_cents;
         }
     } catch (err) {
         console.error("Erro ao verificar carrinho:", err);
@@ -736,9 +751,18 @@ function mostrarResumoCompleto() {
         resumoItensDiv.innerHTML = checkoutData.items.map(item => `
             <div class="resumo-item">
                 <strong>${item.pizza.name} (x${item.quantity})</strong>
-                <span>R$ ${(item.pizza.price * item.quantity).toFixed(2).replace('.', ',')}</span>
+                <span>R$ ${(item.subtotal_cents / 100).toFixed(2).replace('.', ',')}</span>
             </div>
         `).join('');
+
+        if (checkoutData.discount_cents > 0) {
+            resumoItensDiv.innerHTML += `
+                <div class="resumo-item">
+                    <strong>Desconto (combos)</strong>
+                    <span>- R$ ${(checkoutData.discount_cents / 100).toFixed(2).replace('.', ',')}</span>
+                </div>
+            `;
+        }
     }
     
     const resumoValorSpan = document.getElementById("resumo-valor");
@@ -3,42 +3,44 @@ BELLA PIZZARIA - Backend Completo com Banco de Dados
 Porta: 8000
 Banco: SQLite com SQLAlchemy
 Autenticação: JWT
+
+Uso: create_app(config_name) monta a aplicação (ver config_bella.py)
 """
 
 import os
+import math
 import logging
-from flask import Flask, request, jsonify, send_from_directory
+import threading
+from itertools import chain
+import click
+from flask import Flask, Blueprint, current_app, has_app_context, request, jsonify, send_from_directory
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-from flask_jwt_extended import create_access_token, get_jwt_identity, jwt_required, JWTManager
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from flask_jwt_extended import (create_access_token, get_jwt_identity, jwt_required,
+                                verify_jwt_in_request, JWTManager)
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
 from flask_cors import CORS
 from werkzeug.security import generate_password_hash, check_password_hash
+from pricing_bella import ALL_WEEKDAYS, MINUTES_PER_DAY, PricingEngine, Rule, cents_to_reais
+from ratelimit_bella import RateLimiter, create_store
 
 # -------------------------------------------------------------------
-# 1. CONFIGURAÇÃO FLASK
+# 1. EXTENSÕES (inicializadas em create_app)
 # -------------------------------------------------------------------
 
 basedir = os.path.abspath(os.path.dirname(__file__))
 frontend_folder = os.path.join(os.path.dirname(basedir), 'frontend')
 
-app = Flask(__name__, 
-            static_folder="static",
-            template_folder=frontend_folder,
-            static_url_path='/backend-static')
-CORS(app)
-
-# Configurar logging - LOGS DE REQUISIÇÕES HABILITADOS
-import sys
-log = logging.getLogger('werkzeug')
-log.setLevel(logging.INFO)  # Mostrar requisições HTTP no terminal
+# Versão do esquema gravada no PRAGMA user_version do SQLite.
+# Incrementar sempre que os modelos mudarem.
+SCHEMA_VERSION = 2
 
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(basedir, 'bella_pizzaria.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['JWT_SECRET_KEY'] = 'pizzaria-delicia-secret-key-2025'
+db = SQLAlchemy()
+jwt = JWTManager()
 
-db = SQLAlchemy(app)
-migrate = Migrate(app, db)
-jwt = JWTManager(app)
+bp = Blueprint('bella', __name__)
 
 # -------------------------------------------------------------------
 # 2. MODELOS DO BANCO DE DADOS
@@ -73,7 +75,7 @@ class Pizza(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True, nullable=False)
     description = db.Column(db.String(255), nullable=False)
-    price = db.Column(db.Float, nullable=False)
+    price_cents = db.Column(db.Integer, nullable=False)
     image_filename = db.Column(db.String(255), nullable=True)
     category_id = db.Column(db.String(50), nullable=True)
 
@@ -82,7 +84,8 @@ class Pizza(db.Model):
             "id": self.id,
             "name": self.name,
             "description": self.description,
-            "price": self.price,
+            "price": cents_to_reais(self.price_cents),
+            "price_cents": self.price_cents,
             "image_path": f"/static/img/{self.image_filename}" if self.image_filename else "/static/img/pizza-default.jpg",
             "category_id": self.category_id
         }
@@ -107,11 +110,110 @@ class CartItem(db.Model):
         }
 
 
+class Promotion(db.Model):
+    __tablename__ = 'promotion'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)  # percent, amount_off, fixed_price, combo
+    value = db.Column(db.Integer, nullable=False)  # % ou centavos (ver pricing_bella.py)
+    combo_size = db.Column(db.Integer, nullable=True)
+    pizza_id = db.Column(db.Integer, db.ForeignKey('pizza.id'), nullable=True)
+    category_id = db.Column(db.String(50), nullable=True)
+    weekdays = db.Column(db.Integer, nullable=False, default=ALL_WEEKDAYS)
+    start_minute = db.Column(db.Integer, nullable=False, default=0)
+    end_minute = db.Column(db.Integer, nullable=False, default=MINUTES_PER_DAY)
+    starts_at = db.Column(db.DateTime, nullable=True)
+    ends_at = db.Column(db.DateTime, nullable=True)
+    active = db.Column(db.Boolean, nullable=False, default=True)
+
+    def to_rule(self):
+        return Rule(self.id, self.kind, self.value, self.pizza_id, self.category_id,
+                    self.combo_size, self.weekdays, self.start_minute, self.end_minute,
+                    self.starts_at, self.ends_at)
+
+
+# -------------------------------------------------------------------
+# 3. PREÇOS E PROMOÇÕES
+# -------------------------------------------------------------------
+
+def load_pricing_data():
+    """Carregar cardápio e promoções ativas para o motor de preços"""
+    pizzas = db.session.query(Pizza.id, Pizza.category_id, Pizza.price_cents).all()
+    rules = [p.to_rule() for p in Promotion.query.filter_by(active=True)]
+    return [tuple(p) for p in pizzas], rules
+
+
+def pricing():
+    """Motor de preços da aplicação atual"""
+    return current_app.extensions['pricing']
+
+
+def priced_pizza(pizza, table):
+    """Pizza com o preço efetivo da janela atual (promoções aplicadas)"""
+    data = pizza.to_dict()
+    cents = table.prices.get(pizza.id, pizza.price_cents)
+    data["effective_price"] = cents_to_reais(cents)
+    data["effective_price_cents"] = cents
+    return data
+
+
+@event.listens_for(Session, 'before_flush')
+def _mark_pricing_dirty(session, flush_context, instances):
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (Pizza, Promotion)):
+            session.info['pricing_dirty'] = True
+            return
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_pricing(session):
+    if session.info.pop('pricing_dirty', False) and has_app_context():
+        engine = current_app.extensions.get('pricing')
+        if engine is not None:
+            engine.invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_pricing_dirty(session):
+    session.info.pop('pricing_dirty', None)
+
+
+# -------------------------------------------------------------------
+# 4. CONTROLE DE ADMISSÃO (RATE LIMIT)
+# -------------------------------------------------------------------
+
+def rate_limit_client():
+    """Identificar o cliente pelo JWT (se válido) ou pelo IP"""
+    try:
+        verify_jwt_in_request(optional=True)
+        identity = get_jwt_identity()
+    except (JWTExtendedException, PyJWTError):
+        identity = None
+    return f"user:{identity}" if identity else f"ip:{request.remote_addr}"
+
+
+@bp.before_request
+def check_rate_limit():
+    """Recusar com 429 quando o cliente esgotou as fichas da rota"""
+    limiter = current_app.extensions.get('ratelimit')
+    if limiter is None or request.method == 'OPTIONS' or request.endpoint not in limiter.limits:
+        return None
+
+    retry_after = limiter.hit(request.endpoint, rate_limit_client())
+    if retry_after is None:
+        return None
+
+    return jsonify({
+        "message": "Muitas requisições. Tente novamente em instantes."
+    }), 429, {"Retry-After": str(math.ceil(retry_after))}
+
+
 # -------------------------------------------------------------------
-# 3. ROTAS - HOME
+# 5. ROTAS - HOME
 # -------------------------------------------------------------------
 
-@app.route('/api')
+@bp.route('/api')
 def api_info():
     return jsonify({
         "message": "🍕 Bella Pizzaria API está funcionando!",
@@ -125,11 +227,20 @@ def api_info():
     }), 200
 
 
+@bp.route('/metrics', methods=['GET'])
+def metrics():
+    """Contadores do rate limit deste processo"""
+    limiter = current_app.extensions.get('ratelimit')
+    return jsonify({
+        "ratelimit": limiter.stats() if limiter is not None else {}
+    }), 200
+
+
 # -------------------------------------------------------------------
-# 4. ROTAS - AUTENTICAÇÃO
+# 6. ROTAS - AUTENTICAÇÃO
 # -------------------------------------------------------------------
 
-@app.route('/auth/register', methods=['POST'])
+@bp.route('/auth/register', methods=['POST'])
 def register():
     """Criar nova conta de usuário"""
     data = request.form
@@ -155,7 +266,7 @@ def register():
     }), 201
 
 
-@app.route('/auth/login', methods=['POST'])
+@bp.route('/auth/login', methods=['POST'])
 def login():
     """Fazer login e receber token JWT"""
     data = request.form
@@ -180,30 +291,31 @@ def login():
 
 
 # -------------------------------------------------------------------
-# 5. ROTAS - PIZZAS
+# 7. ROTAS - PIZZAS
 # -------------------------------------------------------------------
 
-@app.route('/pizzas', methods=['GET'])
+@bp.route('/pizzas', methods=['GET'])
 def get_pizzas():
     """Listar todas as pizzas disponíveis"""
     pizzas = Pizza.query.all()
-    return jsonify([p.to_dict() for p in pizzas]), 200
+    table = pricing().table()
+    return jsonify([priced_pizza(p, table) for p in pizzas]), 200
 
 
-@app.route('/pizzas/<int:pizza_id>', methods=['GET'])
+@bp.route('/pizzas/<int:pizza_id>', methods=['GET'])
 def get_pizza(pizza_id):
     """Buscar uma pizza específica"""
     pizza = db.session.get(Pizza, pizza_id)
     if not pizza:
         return jsonify({"message": "Pizza não encontrada"}), 404
-    return jsonify(pizza.to_dict()), 200
+    return jsonify(priced_pizza(pizza, pricing().table())), 200
 
 
 # -------------------------------------------------------------------
-# 6. ROTAS - CARRINHO
+# 8. ROTAS - CARRINHO
 # -------------------------------------------------------------------
 
-@app.route('/cart', methods=['GET'])
+@bp.route('/cart', methods=['GET'])
 @jwt_required()
 def get_cart():
     """Obter carrinho do usuário logado"""
@@ -213,17 +325,28 @@ def get_cart():
     if not user:
         return jsonify({"message": "Usuário não encontrado"}), 404
 
-    items = [i.to_dict() for i in user.cart_items.all()]
-    total = sum(i['pizza']['price'] * i['quantity'] for i in items)
+    cart_items = user.cart_items.all()
+    quote = pricing().quote((i.pizza_id, i.quantity) for i in cart_items)
+
+    items = []
+    for cart_item, line in zip(cart_items, quote.lines):
+        item = cart_item.to_dict()
+        item["unit_price"] = cents_to_reais(line.unit_price_cents)
+        item["unit_price_cents"] = line.unit_price_cents
+        item["subtotal_cents"] = line.total_cents
+        items.append(item)
 
     return jsonify({
         "items": items,
-        "total": total,
+        "subtotal_cents": quote.subtotal_cents,
+        "discount_cents": quote.discount_cents,
+        "total": cents_to_reais(quote.total_cents),
+        "total_cents": quote.total_cents,
         "count": len(items)
     }), 200
 
 
-@app.route('/cart/add', methods=['POST'])
+@bp.route('/cart/add', methods=['POST'])
 @jwt_required()
 def add_to_cart():
     """Adicionar pizza ao carrinho"""
@@ -253,7 +376,7 @@ def add_to_cart():
     }), 201
 
 
-@app.route('/cart/remove', methods=['POST'])
+@bp.route('/cart/remove', methods=['POST'])
 @jwt_required()
 def remove_from_cart():
     """Remover pizza do carrinho"""
@@ -271,7 +394,7 @@ def remove_from_cart():
     return jsonify({"message": "Item removido do carrinho!"}), 200
 
 
-@app.route('/cart/clear', methods=['POST'])
+@bp.route('/cart/clear', methods=['POST'])
 @jwt_required()
 def clear_cart():
     """Limpar todo o carrinho"""
@@ -282,10 +405,10 @@ def clear_cart():
 
 
 # -------------------------------------------------------------------
-# 7. ROTAS - DADOS DO USUÁRIO
+# 9. ROTAS - DADOS DO USUÁRIO
 # -------------------------------------------------------------------
 
-@app.route('/user/me', methods=['GET'])
+@bp.route('/user/me', methods=['GET'])
 @jwt_required()
 def get_user_data():
     """Retorna dados do usuário logado para auto-completar formulários"""
@@ -303,10 +426,10 @@ def get_user_data():
 
 
 # -------------------------------------------------------------------
-# 8. ROTAS - CHECKOUT
+# 10. ROTAS - CHECKOUT
 # -------------------------------------------------------------------
 
-@app.route('/checkout', methods=['POST'])
+@bp.route('/checkout', methods=['POST'])
 @jwt_required()
 def checkout():
     """Finalizar pedido com dados completos"""
@@ -329,8 +452,8 @@ def checkout():
     if not items:
         return jsonify({"error": "Carrinho vazio!"}), 400
 
-    # Calcular total
-    total = sum(item.pizza.price * item.quantity for item in items)
+    # Calcular total (centavos, com promoções vigentes)
+    quote = pricing().quote((item.pizza_id, item.quantity) for item in items)
 
     # Validar CPF (11 dígitos)
     cpf_numeros = ''.join(filter(str.isdigit, cpf))
@@ -345,7 +468,9 @@ def checkout():
     
     return jsonify({
         "message": "Pedido finalizado com sucesso!",
-        "total": total,
+        "total": cents_to_reais(quote.total_cents),
+        "total_cents": quote.total_cents,
+        "discount_cents": quote.discount_cents,
         "endereco": endereco,
         "pagamento": pagamento,
         "cpf": cpf,
@@ -355,119 +480,260 @@ def checkout():
 
 
 # -------------------------------------------------------------------
-# 9. SERVIR ARQUIVOS ESTÁTICOS (Imagens)
+# 11. SERVIR ARQUIVOS ESTÁTICOS (Imagens)
 # -------------------------------------------------------------------
 
-@app.route('/static/<path:filename>')
+@bp.route('/static/<path:filename>')
 def serve_static(filename):
     """Servir imagens e arquivos estáticos do backend"""
-    return send_from_directory(app.static_folder, filename)
+    return send_from_directory(current_app.static_folder, filename)
 
 
 # Servir arquivos do frontend (CSS, JS, imagens)
-@app.route('/css/<path:filename>')
+@bp.route('/css/<path:filename>')
 def serve_css(filename):
     return send_from_directory(os.path.join(frontend_folder, 'css'), filename)
 
-@app.route('/js/<path:filename>')
+@bp.route('/js/<path:filename>')
 def serve_js(filename):
     return send_from_directory(os.path.join(frontend_folder, 'js'), filename)
 
-@app.route('/img/<path:filename>')
+@bp.route('/img/<path:filename>')
 def serve_img(filename):
     return send_from_directory(os.path.join(frontend_folder, 'img'), filename)
 
-@app.route('/static/favicon.svg')
+@bp.route('/static/favicon.svg')
 def serve_favicon_svg():
     return send_from_directory(os.path.join(frontend_folder, 'static'), 'favicon.svg')
 
 
 # Rotas do frontend HTML
-@app.route('/')
+@bp.route('/')
 def index_page():
     return send_from_directory(frontend_folder, 'index.html')
 
-@app.route('/cardapio.html')
+@bp.route('/cardapio.html')
 def cardapio_page():
     return send_from_directory(frontend_folder, 'cardapio.html')
 
-@app.route('/login.html')
+@bp.route('/login.html')
 def login_page():
     return send_from_directory(frontend_folder, 'login.html')
 
-@app.route('/cadastro.html')
+@bp.route('/cadastro.html')
 def cadastro_page():
     return send_from_directory(frontend_folder, 'cadastro.html')
 
-@app.route('/carrinho.html')
+@bp.route('/carrinho.html')
 def carrinho_page():
     return send_from_directory(frontend_folder, 'carrinho.html')
 
-@app.route('/favicon.ico')
+@bp.route('/favicon.ico')
 def favicon():
     """Servir favicon para evitar 404"""
     return '', 204
 
 
 # -------------------------------------------------------------------
-# 9. POPULAR BANCO COM DADOS INICIAIS
+# 12. POPULAR BANCO COM DADOS INICIAIS
 # -------------------------------------------------------------------
 
-def seed_database():
-    """Popular banco com pizzas iniciais"""
+def seed_database(conn):
+    """Popular banco com pizzas iniciais (na transação de init_database)"""
     
     # Verificar se já existem pizzas
-    if Pizza.query.count() > 0:
+    if conn.execute(db.select(db.func.count()).select_from(Pizza.__table__)).scalar() > 0:
         print("✅ Banco já contém pizzas!")
         return
 
     print("🔄 Populando banco de dados...")
 
     pizzas = [
-        ("Margherita", "Molho de tomate, mussarela e manjericão fresco", 45.90, "pizza margherita.jpeg", "tradicionais"),
-        ("Calabresa", "Calabresa fatiada, cebola roxa e azeitonas", 48.90, "calabresa.jpeg", "tradicionais"),
-        ("Portuguesa", "Presunto, ovos, cebola, mussarela e azeitonas", 52.90, "portuguesa.jpeg", "tradicionais"),
-        ("Quatro Queijos", "Mussarela, provolone, gorgonzola e parmesão", 55.90, "quatro queijos.jpeg", "especiais"),
-        ("Frango Catupiry", "Frango desfiado com catupiry cremoso", 51.90, "frango com catupiry.jpeg", "especiais"),
-        ("Pepperoni", "Pepperoni italiano e mussarela especial", 58.90, "pepperoni.jpeg", "especiais"),
-        ("Vegetariana", "Tomate, pimentão, cebola, champignon e azeitonas", 49.90, "vegetariana.jpeg", "vegetarianas"),
-        ("Napolitana", "Mussarela, tomate em rodelas e parmesão ralado", 47.90, "pizza napolitana.jpeg", "tradicionais")
+        ("Margherita", "Molho de tomate, mussarela e manjericão fresco", 4590, "pizza margherita.jpeg", "tradicionais"),
+        ("Calabresa", "Calabresa fatiada, cebola roxa e azeitonas", 4890, "calabresa.jpeg", "tradicionais"),
+        ("Portuguesa", "Presunto, ovos, cebola, mussarela e azeitonas", 5290, "portuguesa.jpeg", "tradicionais"),
+        ("Quatro Queijos", "Mussarela, provolone, gorgonzola e parmesão", 5590, "quatro queijos.jpeg", "especiais"),
+        ("Frango Catupiry", "Frango desfiado com catupiry cremoso", 5190, "frango com catupiry.jpeg", "especiais"),
+        ("Pepperoni", "Pepperoni italiano e mussarela especial", 5890, "pepperoni.jpeg", "especiais"),
+        ("Vegetariana", "Tomate, pimentão, cebola, champignon e azeitonas", 4990, "vegetariana.jpeg", "vegetarianas"),
+        ("Napolitana", "Mussarela, tomate em rodelas e parmesão ralado", 4790, "pizza napolitana.jpeg", "tradicionais")
     ]
 
-    for name, desc, price, img, cat in pizzas:
-        pizza = Pizza(
-            name=name,
-            description=desc,
-            price=price,
-            image_filename=img,
-            category_id=cat
-        )
-        db.session.add(pizza)
-
-    db.session.commit()
+    conn.execute(Pizza.__table__.insert(), [
+        {
+            "name": name,
+            "description": desc,
+            "price_cents": price_cents,
+            "image_filename": img,
+            "category_id": cat
+        }
+        for name, desc, price_cents, img, cat in pizzas
+    ])
     print(f"✅ {len(pizzas)} pizzas inseridas no banco!")
 
 
+def _migrate_price_to_cents(conn):
+    """Esquema 1 -> 2: pizza.price (REAL, reais) vira pizza.price_cents (INTEGER)
+
+    A tabela é reconstruída (sem DROP COLUMN, que exige SQLite >= 3.35) dentro da
+    transação de init_database; também recupera tabelas com as duas colunas.
+    """
+    columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(pizza)")}
+    if 'price' not in columns:
+        return
+
+    Pizza.__table__.to_metadata(db.MetaData(), name='pizza_new').create(conn)
+    conn.exec_driver_sql(
+        "INSERT INTO pizza_new (id, name, description, price_cents, image_filename, category_id) "
+        "SELECT id, name, description, CAST(ROUND(price * 100) AS INTEGER), image_filename, category_id "
+        "FROM pizza")
+    conn.exec_driver_sql("DROP TABLE pizza")
+    conn.exec_driver_sql("ALTER TABLE pizza_new RENAME TO pizza")
+    print("✅ Preços convertidos para centavos!")
+
+
+def _check_schema_version(version):
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Banco com esquema {version}, mais novo que o suportado ({SCHEMA_VERSION}); "
+            "atualize a aplicação antes de iniciar.")
+
+
+def init_database():
+    """Criar tabelas e popular o banco apenas se o esquema estiver desatualizado"""
+    # O carimbo de versão (PRAGMA user_version) só existe no SQLite
+    if db.engine.dialect.name != 'sqlite':
+        with db.engine.begin() as conn:
+            db.metadata.create_all(conn)
+            seed_database(conn)
+        return
+
+    with db.engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+    _check_schema_version(version)
+    if version == SCHEMA_VERSION:
+        return
+
+    # Vários workers podem subir juntos num banco novo: BEGIN IMMEDIATE pega o
+    # lock de escrita e a versão é relida dentro da transação. Tudo roda nesta
+    # conexão (outra conexão esperaria pelo mesmo lock).
+    with db.engine.connect() as conn:
+        conn = conn.execution_options(isolation_level='AUTOCOMMIT')
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+            _check_schema_version(version)
+            if version < SCHEMA_VERSION:
+                if version < 2:
+                    _migrate_price_to_cents(conn)
+
+                db.metadata.create_all(conn)
+                print("✅ Tabelas do banco criadas!")
+
+                seed_database(conn)
+                conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.exec_driver_sql("COMMIT")
+        except BaseException:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+
+
+_init_lock = threading.Lock()
+
+
+def init_database_once():
+    """Preparar o banco na primeira requisição (aplicação carregada pelo CLI)"""
+    if current_app.extensions.get('db_ready'):
+        return
+    with _init_lock:
+        if not current_app.extensions.get('db_ready'):
+            init_database()
+            current_app.extensions['db_ready'] = True
+
+
+# -------------------------------------------------------------------
+# 13. FÁBRICA DA APLICAÇÃO
+# -------------------------------------------------------------------
+
+class MigrateGroup(click.Group):
+    """Comando `flask db` que só importa o Flask-Migrate (Alembic) quando usado"""
+
+    def _migrate_cli(self):
+        from flask_migrate import Migrate
+        from flask_migrate.cli import db as db_cli
+
+        if 'migrate' not in current_app.extensions:
+            Migrate(current_app._get_current_object(), db)
+        return db_cli
+
+    def list_commands(self, ctx):
+        return self._migrate_cli().list_commands(ctx)
+
+    def get_command(self, ctx, name):
+        return self._migrate_cli().get_command(ctx, name)
+
+
+def create_app(config_name=None, overrides=None):
+    """Criar e configurar uma instância da aplicação
+
+    overrides (dict) sobrescreve chaves da configuração do ambiente (ex.: testes).
+    """
+    from config_bella import config
+
+    config_name = config_name or os.environ.get('BELLA_ENV', 'default')
+
+    app = Flask(__name__,
+                static_folder="static",
+                template_folder=frontend_folder,
+                static_url_path='/backend-static')
+    app.config.from_object(config[config_name])
+    app.config.update(overrides or {})
+
+    # Configurar logging - LOGS DE REQUISIÇÕES HABILITADOS
+    log = logging.getLogger('werkzeug')
+    log.setLevel(logging.INFO)  # Mostrar requisições HTTP no terminal
+
+    CORS(app)
+    db.init_app(app)
+    jwt.init_app(app)
+
+    app.cli.add_command(MigrateGroup('db', help="Perform database migrations."))
+    app.register_blueprint(bp)
+
+    app.extensions['pricing'] = PricingEngine(
+        load_pricing_data, refresh_seconds=app.config['PRICING_REFRESH_SECONDS'])
+
+    if app.config['RATELIMIT_ENABLED']:
+        store = create_store(app.config['RATELIMIT_STORAGE_URL'], app.config['RATELIMIT_MAX_KEYS'])
+        app.extensions['ratelimit'] = RateLimiter(app.config['RATELIMITS'], store)
+
+    if app.config['AUTO_INIT_DB']:
+        # No CLI (`flask db ...`, `flask shell`) o esquema fica por conta do
+        # comando; em `flask run` o banco é preparado na primeira requisição
+        if os.environ.get('FLASK_RUN_FROM_CLI') == 'true':
+            app.before_request(init_database_once)
+        else:
+            with app.app_context():
+                init_database()
+
+    return app
+
+
 # -------------------------------------------------------------------
-# 10. INICIALIZAR APLICAÇÃO
+# 14. INICIALIZAR APLICAÇÃO
 # -------------------------------------------------------------------
 
 if __name__ == "__main__":
-    with app.app_context():
-        # Criar todas as tabelas
-        db.create_all()
-        print("✅ Tabelas do banco criadas!")
-        
-        # Popular com dados iniciais
-        seed_database()
-        
-        print("\n" + "="*50)
-        print("🍕 BELLA PIZZARIA - API REST")
-        print("="*50)
-        print("🌐 Servidor: http://127.0.0.1:8000")
-        print("📊 Banco: SQLite (bella_pizzaria.db)")
-        print("🔐 Autenticação: JWT")
-        print("✅ Sistema pronto!")
-        print("="*50 + "\n")
+    app = create_app()
+
+    print("\n" + "="*50)
+    print("🍕 BELLA PIZZARIA - API REST")
+    print("="*50)
+    print("🌐 Servidor: http://127.0.0.1:8000")
+    print("📊 Banco: SQLite (bella_pizzaria.db)")
+    print("🔐 Autenticação: JWT")
+    print("✅ Sistema pronto!")
+    print("="*50 + "\n")
 
     app.run(debug=False, port=8000, host='0.0.0.0', threaded=True)
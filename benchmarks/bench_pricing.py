@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BELLA PIZZARIA - Benchmark do motor de preços
+Gera um cardápio e milhares de promoções sintéticas e mede a compilação da
+tabela de preços (virada de janela) e o cálculo de um carrinho grande.
+
+Uso: python benchmarks/bench_pricing.py [regras] [itens_no_carrinho]
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pricing_bella import ALL_WEEKDAYS, MINUTES_PER_DAY, PricingEngine, Rule  # noqa: E402
+
+PIZZAS = 500
+CATEGORIAS = ["tradicionais", "especiais", "vegetarianas", "doces", "premium"]
+TIPOS = ["percent", "amount_off", "fixed_price", "combo"]
+
+
+def gerar_dados(n_regras, agora, rng):
+    """Cardápio e regras sintéticas (escopos, janelas e vigências variadas)"""
+    pizzas = [(pid, rng.choice(CATEGORIAS), rng.randrange(3000, 9000, 10))
+              for pid in range(1, PIZZAS + 1)]
+
+    regras = []
+    for rid in range(1, n_regras + 1):
+        kind = rng.choice(TIPOS)
+        value = {"percent": rng.randint(5, 40),
+                 "amount_off": rng.randrange(100, 1500, 10),
+                 "fixed_price": rng.randrange(2500, 6000, 10),
+                 "combo": rng.randrange(300, 1500, 10)}[kind]
+        escopo = rng.random()
+        pizza_id = rng.randint(1, PIZZAS) if escopo < 0.6 else None
+        category_id = rng.choice(CATEGORIAS) if 0.6 <= escopo < 0.95 else None
+        inicio = rng.randrange(0, MINUTES_PER_DAY, 30)
+        fim = min(inicio + rng.randrange(60, 480, 30), MINUTES_PER_DAY)
+        if rng.random() < 0.3:
+            inicio, fim = 0, MINUTES_PER_DAY
+        starts_at = agora - timedelta(days=rng.randint(0, 10)) if rng.random() < 0.5 else None
+        ends_at = agora + timedelta(days=rng.randint(1, 10)) if rng.random() < 0.5 else None
+        regras.append(Rule(rid, kind, value, pizza_id, category_id,
+                           rng.randint(2, 4) if kind == "combo" else None,
+                           rng.choice([ALL_WEEKDAYS, 0b0011111, 0b1100000]),
+                           inicio, fim, starts_at, ends_at))
+    return pizzas, regras
+
+
+def medir(fn, repeticoes):
+    amostras = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        fn()
+        amostras.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(amostras), min(amostras)
+
+
+def main():
+    n_regras = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    n_itens = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rng = random.Random(42)
+    agora = datetime(2026, 1, 16, 18, 30)
+
+    pizzas, regras = gerar_dados(n_regras, agora, rng)
+    engine = PricingEngine(lambda: (pizzas, regras), refresh_seconds=3600)
+    carrinho = [(rng.randint(1, PIZZAS), rng.randint(1, 5)) for _ in range(n_itens)]
+
+    # Cada chamada com invalidate() recarrega as regras e recompila a tabela
+    def recompilar():
+        engine.invalidate()
+        engine.table(agora)
+
+    compilacao = medir(recompilar, 20)
+    engine.table(agora)
+    cotacao = medir(lambda: engine.quote(carrinho, agora), 200)
+    quote = engine.quote(carrinho, agora)
+
+    print("=" * 60)
+    print(f"💰 BENCHMARK DE PREÇOS ({n_regras} regras, {PIZZAS} pizzas, {n_itens} itens)")
+    print("=" * 60)
+    for etapa, (mediana, minimo) in (("compilar tabela", compilacao), ("cotar carrinho", cotacao)):
+        print(f"{etapa:>16}: mediana {mediana:8.3f} ms | mín {minimo:8.3f} ms")
+    print(f"\n   total: R$ {quote.total_cents / 100:.2f}"
+          f" (desconto combos R$ {quote.discount_cents / 100:.2f})")
+
+
+if __name__ == "__main__":
+    main()
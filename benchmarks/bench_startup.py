@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BELLA PIZZARIA - Benchmark de inicialização
+Mede, em processos Python novos, o tempo de importação do app_bella,
+o tempo de create_app() e o tempo até a primeira requisição respondida.
+
+Uso: python benchmarks/bench_startup.py [repetições]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executado em um interpretador novo a cada repetição (cold start)
+CHILD = """
+import json, time
+t0 = time.perf_counter()
+import app_bella
+t1 = time.perf_counter()
+app = app_bella.create_app()
+t2 = time.perf_counter()
+resp = app.test_client().get('/pizzas')
+t3 = time.perf_counter()
+assert resp.status_code == 200
+print(json.dumps({"import": t1 - t0, "create_app": t2 - t1,
+                  "first_request": t3 - t2, "total": t3 - t0}))
+"""
+
+
+def rodar(env):
+    """Executa uma inicialização em um processo novo e retorna os tempos"""
+    out = subprocess.run([sys.executable, "-c", CHILD], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ,
+                   BELLA_ENV="production",
+                   DATABASE_URL="sqlite:///" + os.path.join(tmp, "bench.db"))
+
+        # Primeira execução cria e popula o banco; não entra na medição
+        rodar(env)
+
+        amostras = [rodar(env) for _ in range(repeticoes)]
+
+    print("=" * 60)
+    print(f"🚀 BENCHMARK DE INICIALIZAÇÃO ({repeticoes} repetições)")
+    print("=" * 60)
+    for etapa in ("import", "create_app", "first_request", "total"):
+        valores = [a[etapa] * 1000 for a in amostras]
+        print(f"{etapa:>14}: mediana {statistics.median(valores):8.2f} ms"
+              f" | mín {min(valores):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
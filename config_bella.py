@@ -0,0 +1,60 @@
+"""
+BELLA PIZZARIA - Configurações por ambiente
+Selecione o ambiente com a variável BELLA_ENV (development, testing, production)
+"""
+
+import os
+
+basedir = os.path.abspath(os.path.dirname(__file__))
+
+
+class Config:
+    """Configuração base compartilhada por todos os ambientes"""
+    SQLALCHEMY_DATABASE_URI = os.environ.get(
+        'DATABASE_URL', 'sqlite:///' + os.path.join(basedir, 'bella_pizzaria.db'))
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'pizzaria-delicia-secret-key-2025')
+
+    # Criar tabelas e popular o banco ao subir a aplicação
+    # (no SQLite, pulado quando o PRAGMA user_version já bate com SCHEMA_VERSION;
+    # pelo CLI do Flask, feito só na primeira requisição)
+    AUTO_INIT_DB = True
+
+    # Intervalo máximo (s) para recarregar promoções alteradas fora do ORM
+    PRICING_REFRESH_SECONDS = 60
+
+    # Rate limit por rota (endpoint -> "N/período"), por usuário JWT ou IP.
+    # Use redis://... para compartilhar os limites entre processos.
+    RATELIMIT_ENABLED = True
+    RATELIMIT_STORAGE_URL = os.environ.get('RATELIMIT_STORAGE_URL', 'memory://')
+    RATELIMIT_MAX_KEYS = 10000
+    RATELIMITS = {
+        'bella.login': '5/minute',
+        'bella.register': '3/minute',
+        'bella.add_to_cart': '30/minute',
+        'bella.remove_from_cart': '30/minute',
+        'bella.clear_cart': '10/minute',
+        'bella.checkout': '5/minute',
+    }
+
+
+class DevelopmentConfig(Config):
+    DEBUG = False
+
+
+class TestingConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    RATELIMIT_ENABLED = False
+
+
+class ProductionConfig(Config):
+    DEBUG = False
+
+
+config = {
+    'development': DevelopmentConfig,
+    'testing': TestingConfig,
+    'production': ProductionConfig,
+    'default': DevelopmentConfig,
+}
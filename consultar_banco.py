@@ -51,7 +51,7 @@ def ver_pizzas():
         return
     
     cursor = conn.cursor()
-    cursor.execute("SELECT id, name, description, price, image_filename, category_id FROM pizza;")
+    cursor.execute("SELECT id, name, description, price_cents / 100.0, image_filename, category_id FROM pizza;")
     pizzas = cursor.fetchall()
     
     print("\n" + "="*60)
@@ -103,7 +103,7 @@ def ver_carrinhos():
     
     cursor = conn.cursor()
     cursor.execute("""
-        SELECT ci.id, u.name, p.name, ci.quantity, (p.price * ci.quantity) as subtotal
+        SELECT ci.id, u.name, p.name, ci.quantity, (p.price_cents * ci.quantity) / 100.0 as subtotal
         FROM cart_item ci
         JOIN user u ON ci.user_id = u.id
         JOIN pizza p ON ci.pizza_id = p.id
@@ -149,18 +149,18 @@ def ver_stats():
     total_carrinhos = cursor.fetchone()[0]
     
     # Valores
-    cursor.execute("SELECT AVG(price) FROM pizza;")
+    cursor.execute("SELECT AVG(price_cents) / 100.0 FROM pizza;")
     media_preco = cursor.fetchone()[0] or 0
     
-    cursor.execute("SELECT SUM(p.price * ci.quantity) FROM cart_item ci JOIN pizza p ON ci.pizza_id = p.id;")
+    cursor.execute("SELECT SUM(p.price_cents * ci.quantity) / 100.0 FROM cart_item ci JOIN pizza p ON ci.pizza_id = p.id;")
     total_valor = cursor.fetchone()[0] or 0
     
     # Pizza mais cara
-    cursor.execute("SELECT name, price FROM pizza ORDER BY price DESC LIMIT 1;")
+    cursor.execute("SELECT name, price_cents / 100.0 FROM pizza ORDER BY price_cents DESC LIMIT 1;")
     pizza_mais_cara = cursor.fetchone()
     
     # Pizza mais barata
-    cursor.execute("SELECT name, price FROM pizza ORDER BY price ASC LIMIT 1;")
+    cursor.execute("SELECT name, price_cents / 100.0 FROM pizza ORDER BY price_cents ASC LIMIT 1;")
     pizza_mais_barata = cursor.fetchone()
     
     print("\n" + "="*60)
@@ -185,7 +185,7 @@ def sql_customizado():
     print("\n" + "="*60)
     print("🔧 SQL CUSTOMIZADO")
     print("="*60)
-    print("\nTábelas disponíveis: pizza, user, cart_item")
+    print("\nTábelas disponíveis: pizza, user, cart_item, promotion")
     print("Digite 'sair' para voltar\n")
     
     conn = conectar()
@@ -0,0 +1,273 @@
+"""
+BELLA PIZZARIA - Motor de preços e promoções
+Valores sempre em centavos (int). As promoções ativas são compiladas em uma
+tabela de preços por janela de tempo; o carrinho só faz consultas O(itens).
+
+Tipos de promoção (Rule.kind):
+    percent      - value = % de desconto (15 = 15%)
+    amount_off   - value = centavos de desconto por unidade
+    fixed_price  - value = preço final em centavos
+    combo        - a cada combo_size unidades do escopo, value centavos de desconto
+
+Escopo: pizza_id, category_id ou nenhum dos dois (cardápio inteiro).
+Janela: weekdays (bit 0 = segunda), start_minute/end_minute (minutos desde a
+meia-noite; end < start atravessa a meia-noite e, depois da meia-noite, vale o
+dia em que a janela começou) e starts_at/ends_at opcionais.
+
+Promoções unitárias não se acumulam: vale o menor preço entre todas as regras
+que atingem a pizza (cardápio, categoria e pizza). Combos são aplicados por
+cima, sobre esse preço já descontado.
+
+Regras inválidas são ignoradas: tipo desconhecido, valor negativo, % > 100,
+combo sem combo_size, minutos fora de 0..1440 ou weekdays fora de 0..127.
+"""
+
+import threading
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+MINUTES_PER_DAY = 24 * 60
+ALL_WEEKDAYS = 0b1111111
+KINDS = ('percent', 'amount_off', 'fixed_price', 'combo')
+
+Rule = namedtuple('Rule', [
+    'id', 'kind', 'value', 'pizza_id', 'category_id',
+    'combo_size', 'weekdays', 'start_minute', 'end_minute',
+    'starts_at', 'ends_at',
+])
+
+QuoteLine = namedtuple('QuoteLine', ['pizza_id', 'quantity', 'unit_price_cents', 'total_cents'])
+Quote = namedtuple('Quote', ['lines', 'subtotal_cents', 'discount_cents', 'total_cents'])
+
+
+def cents_to_reais(cents):
+    """Converter centavos para reais (apenas para exibição/JSON)"""
+    return cents / 100
+
+
+def rule_is_valid(rule):
+    """Verificar tipo e valores da promoção (regras inválidas são ignoradas)"""
+    if rule.kind not in KINDS or rule.value is None or rule.value < 0:
+        return False
+    if rule.kind == 'percent' and rule.value > 100:
+        return False
+    if rule.kind == 'combo' and (not rule.combo_size or rule.combo_size < 1):
+        return False
+    for minute in (rule.start_minute, rule.end_minute):
+        if minute is None or not 0 <= minute <= MINUTES_PER_DAY:
+            return False
+    if rule.weekdays is None or not 0 <= rule.weekdays <= ALL_WEEKDAYS:
+        return False
+    return True
+
+
+def rule_applies(rule, now):
+    """Verificar se a promoção está valendo no instante informado"""
+    if rule.starts_at is not None and now < rule.starts_at:
+        return False
+    if rule.ends_at is not None and now >= rule.ends_at:
+        return False
+
+    minute = now.hour * 60 + now.minute
+    start, end = rule.start_minute, rule.end_minute
+    weekday = now.weekday()
+    if start <= end:
+        if not start <= minute < end:
+            return False
+    elif minute < end:
+        # Madrugada de uma janela que começou no dia anterior
+        weekday = (weekday - 1) % 7
+    elif minute < start:
+        return False
+
+    return bool((rule.weekdays >> weekday) & 1)
+
+
+def _apply_unit_rule(kind, value, base):
+    if kind == 'percent':
+        return max(base - (base * value + 50) // 100, 0)
+    if kind == 'amount_off':
+        return max(base - value, 0)
+    return min(base, value)  # fixed_price nunca aumenta o preço
+
+
+class RuleSet:
+    """Regras e cardápio carregados do banco, com as fronteiras de janela indexadas"""
+
+    def __init__(self, pizzas, rules, loaded_at, generation=0):
+        self.pizzas = pizzas  # [(pizza_id, category_id, price_cents), ...]
+        self.rules = rules
+        self.loaded_at = loaded_at
+        self.generation = generation
+
+        # Meia-noite é sempre fronteira (weekdays muda de um dia para o outro)
+        minutes = {0}
+        dates = set()
+        for r in rules:
+            minutes.update(m for m in (r.start_minute, r.end_minute) if 0 < m < MINUTES_PER_DAY)
+            dates.update(d for d in (r.starts_at, r.ends_at) if d is not None)
+        self._minutes = sorted(minutes)
+        self._dates = sorted(dates)
+
+    def window(self, now):
+        """Retornar (início, fim) da janela em que nenhuma regra muda de estado"""
+        midnight = datetime.combine(now.date(), time())
+        i = bisect_right(self._minutes, now.hour * 60 + now.minute)
+        start = midnight + timedelta(minutes=self._minutes[i - 1])
+        if i < len(self._minutes):
+            end = midnight + timedelta(minutes=self._minutes[i])
+        else:
+            end = midnight + timedelta(days=1)
+
+        j = bisect_right(self._dates, now)
+        if j > 0:
+            start = max(start, self._dates[j - 1])
+        if j < len(self._dates):
+            end = min(end, self._dates[j])
+        return start, end
+
+    def compile(self, now):
+        """Compilar as regras ativas em now numa tabela de preços"""
+        # Reduz as regras de cada escopo ao melhor efeito possível: O(regras)
+        unit_rules = {}  # escopo -> {kind: melhor value}
+        combos = {}      # escopo -> melhor combo (rule_id, combo_size, value)
+        for r in self.rules:
+            if not rule_is_valid(r) or not rule_applies(r, now):
+                continue
+            if r.pizza_id is not None:
+                scope = ('pizza', r.pizza_id)
+            elif r.category_id is not None:
+                scope = ('category', r.category_id)
+            else:
+                scope = None
+
+            if r.kind == 'combo':
+                best = combos.get(scope)
+                if best is None or r.value * best[1] > best[2] * r.combo_size:
+                    combos[scope] = (r.id, r.combo_size, r.value)
+                continue
+
+            best = unit_rules.setdefault(scope, {})
+            current = best.get(r.kind)
+            if current is None:
+                best[r.kind] = r.value
+            elif r.kind == 'fixed_price':
+                best[r.kind] = min(current, r.value)
+            else:
+                best[r.kind] = max(current, r.value)
+
+        prices = {}
+        combo_of = {}
+        for pizza_id, category_id, base in self.pizzas:
+            price = base
+            best_combo = None
+            for scope in (None, ('category', category_id), ('pizza', pizza_id)):
+                for kind, value in unit_rules.get(scope, {}).items():
+                    price = min(price, _apply_unit_rule(kind, value, base))
+                combo = combos.get(scope)
+                if combo is not None and (best_combo is None or
+                                          combo[2] * best_combo[1] > best_combo[2] * combo[1]):
+                    best_combo = combo
+            prices[pizza_id] = price
+            if best_combo is not None:
+                combo_of[pizza_id] = best_combo
+
+        return PriceTable(prices, combo_of)
+
+
+class PriceTable:
+    """Preços efetivos (centavos) de uma janela de tempo"""
+
+    def __init__(self, prices, combo_of):
+        self.prices = prices
+        self.combo_of = combo_of
+        self.valid_from = None
+        self.valid_until = None
+        self.generation = None
+
+    def quote(self, lines):
+        """Calcular o total de [(pizza_id, quantidade), ...] em O(itens)"""
+        prices = self.prices
+        combo_of = self.combo_of
+        out = []
+        subtotal = 0
+        pools = {}  # combo -> [unidades, subtotal do combo]
+        for pizza_id, quantity in lines:
+            unit = prices[pizza_id]
+            line_total = unit * quantity
+            subtotal += line_total
+            out.append(QuoteLine(pizza_id, quantity, unit, line_total))
+
+            combo = combo_of.get(pizza_id)
+            if combo is not None:
+                pool = pools.setdefault(combo, [0, 0])
+                pool[0] += quantity
+                pool[1] += line_total
+
+        # Cada combo só desconta das pizzas que fazem parte dele
+        discount = 0
+        for combo, (units, pool_subtotal) in pools.items():
+            discount += max(min((units // combo[1]) * combo[2], pool_subtotal), 0)
+        return Quote(out, subtotal, discount, subtotal - discount)
+
+
+class PricingEngine:
+    """Mantém a tabela de preços da janela atual e a reconstrói quando preciso
+
+    loader() deve retornar (pizzas, regras) no formato de RuleSet. As regras são
+    recarregadas após invalidate() ou a cada refresh_seconds; ao virar a janela
+    a tabela é recompilada a partir das regras já carregadas.
+    """
+
+    def __init__(self, loader, refresh_seconds=60, clock=datetime.now):
+        self._loader = loader
+        self._refresh = timedelta(seconds=refresh_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._ruleset = None
+        self._table = None
+
+    def invalidate(self):
+        """Descartar regras e tabela (promoções ou preços mudaram)"""
+        self._generation += 1
+
+    def table(self, now=None):
+        now = now or self._clock()
+        table = self._table
+        if (table is not None and table.generation == self._generation
+                and table.valid_from <= now < table.valid_until):
+            return table
+
+        with self._lock:
+            table = self._table
+            if (table is not None and table.generation == self._generation
+                    and table.valid_from <= now < table.valid_until):
+                return table
+            return self._rebuild(now)
+
+    def quote(self, lines, now=None):
+        """Calcular o total do carrinho com as promoções vigentes"""
+        lines = list(lines)
+        try:
+            return self.table(now).quote(lines)
+        except KeyError:
+            # Pizza criada fora do ORM depois da última carga
+            self.invalidate()
+            return self.table(now).quote(lines)
+
+    def _rebuild(self, now):
+        generation = self._generation
+        ruleset = self._ruleset
+        if (ruleset is None or ruleset.generation != generation
+                or now >= ruleset.loaded_at + self._refresh or now < ruleset.loaded_at):
+            pizzas, rules = self._loader()
+            ruleset = self._ruleset = RuleSet(pizzas, rules, now, generation)
+
+        table = ruleset.compile(now)
+        table.valid_from, table.valid_until = ruleset.window(now)
+        table.valid_until = min(table.valid_until, ruleset.loaded_at + self._refresh)
+        table.generation = generation
+        self._table = table
+        return table
@@ -0,0 +1,156 @@
+"""
+BELLA PIZZARIA - Controle de admissão (rate limiting)
+Token bucket por rota e por cliente (identidade JWT ou IP).
+
+Limites no formato "N/período" (second, minute, hour, day): o cliente pode
+fazer até N requisições seguidas e recupera N fichas por período.
+
+Armazenamento:
+    memory://            - em processo, LRU com no máximo max_keys buckets
+    redis://host:6379/0  - compartilhado entre processos (requer o pacote redis)
+
+Se o armazenamento falhar, a requisição é admitida (fail open) e contada
+como store_errors.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+log = logging.getLogger(__name__)
+
+
+class StoreError(Exception):
+    """Falha ao consultar o armazenamento compartilhado dos buckets"""
+
+
+def parse_limit(limit):
+    """Converter "5/minute" em (capacidade, fichas por segundo)"""
+    amount, _, period = limit.partition('/')
+    amount = int(amount)
+    if amount < 1 or period not in PERIODS:
+        raise ValueError(f"Limite inválido: {limit!r}")
+    return amount, amount / PERIODS[period]
+
+
+class MemoryStore:
+    """Buckets em memória; O(1) por consulta e descarta o menos usado ao lotar"""
+
+    def __init__(self, max_keys=10000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # chave -> (fichas, instante)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def consume(self, key, capacity, rate, now):
+        """Gastar uma ficha; retorna 0 se admitido ou os segundos até a próxima"""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                tokens = capacity
+            else:
+                tokens, stamp = bucket
+                tokens = min(capacity, tokens + max(now - stamp, 0) * rate)
+                self._buckets.move_to_end(key)
+
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0
+            else:
+                retry_after = (1 - tokens) / rate
+
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return retry_after
+
+
+class RedisStore:
+    """Buckets no Redis, atualizados atomicamente por script Lua"""
+
+    SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'stamp')
+    local tokens = tonumber(bucket[1]) or capacity
+    local stamp = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(now - stamp, 0) * rate)
+
+    local retry_after = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    else
+        retry_after = (1 - tokens) / rate
+    end
+
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'stamp', tostring(now))
+    redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+    return tostring(retry_after)
+    """
+
+    def __init__(self, url, prefix='bella:ratelimit:'):
+        import redis  # dependência opcional
+
+        self.prefix = prefix
+        self._errors = redis.RedisError
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    def consume(self, key, capacity, rate, now):
+        try:
+            return float(self._script(keys=[self.prefix + key], args=[capacity, rate, now]))
+        except self._errors as e:
+            raise StoreError(str(e)) from e
+
+
+def create_store(url, max_keys=10000):
+    """Criar o armazenamento a partir de RATELIMIT_STORAGE_URL"""
+    if url.startswith('memory://'):
+        return MemoryStore(max_keys)
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisStore(url)
+    raise ValueError(f"Armazenamento de rate limit desconhecido: {url!r}")
+
+
+class RateLimiter:
+    """Aplica os limites por rota e contabiliza admitidas/recusadas"""
+
+    def __init__(self, limits, store, clock=time.time):
+        self.limits = {endpoint: parse_limit(limit) for endpoint, limit in limits.items()}
+        self.store = store
+        self._clock = clock
+        self._counters = Counter()
+        self._lock = threading.Lock()
+
+    def hit(self, endpoint, client):
+        """Registrar uma requisição; retorna None se admitida ou o Retry-After (s)"""
+        capacity, rate = self.limits[endpoint]
+        try:
+            retry_after = self.store.consume(f"{endpoint}:{client}", capacity, rate, self._clock())
+        except StoreError as e:
+            # Sem o armazenamento, admitir em vez de derrubar a rota
+            log.warning("Rate limit indisponível em %s: %s", endpoint, e)
+            retry_after = 0
+            outcome = 'store_errors'
+        else:
+            outcome = 'limited' if retry_after else 'allowed'
+
+        with self._lock:
+            self._counters[endpoint, outcome] += 1
+        return retry_after or None
+
+    def stats(self):
+        """Contadores por rota: {endpoint: {"allowed": n, "limited": n, "store_errors": n}}"""
+        with self._lock:
+            counters = dict(self._counters)
+        stats = {endpoint: {'allowed': 0, 'limited': 0, 'store_errors': 0}
+                 for endpoint in self.limits}
+        for (endpoint, outcome), count in counters.items():
+            stats[endpoint][outcome] = count
+        return stats
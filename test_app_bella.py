@@ -0,0 +1,124 @@
+"""Testes da fábrica da aplicação e da inicialização do banco (app_bella.py)"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+import app_bella
+from app_bella import SCHEMA_VERSION, create_app
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def banco(tmp_path):
+    path = tmp_path / 'bella.db'
+    return path, {'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}'}
+
+
+def user_version(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def test_create_app_testing_serve_pizzas_do_seed():
+    app = create_app('testing')
+
+    assert app.config['TESTING']
+    assert 'ratelimit' not in app.extensions
+
+    resp = app.test_client().get('/pizzas')
+    assert resp.status_code == 200
+    assert len(resp.json) == 8
+    assert all(p['price_cents'] > 0 for p in resp.json)
+
+
+def test_segundo_create_app_pula_inicializacao(tmp_path, monkeypatch):
+    path, overrides = banco(tmp_path)
+    create_app('testing', overrides)
+    assert user_version(path) == SCHEMA_VERSION
+
+    def falhar(conn):
+        raise AssertionError("seed_database não deveria rodar")
+    monkeypatch.setattr(app_bella, 'seed_database', falhar)
+
+    app = create_app('testing', overrides)
+    assert len(app.test_client().get('/pizzas').json) == 8
+
+
+def test_banco_com_esquema_mais_novo_nao_sobe(tmp_path):
+    path, overrides = banco(tmp_path)
+    with sqlite3.connect(path) as conn:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+    with pytest.raises(RuntimeError):
+        create_app('testing', overrides)
+    assert user_version(path) == SCHEMA_VERSION + 1
+
+
+def test_cli_adia_inicializacao_para_primeira_requisicao(tmp_path, monkeypatch):
+    path, overrides = banco(tmp_path)
+    monkeypatch.setenv('FLASK_RUN_FROM_CLI', 'true')
+
+    app = create_app('testing', overrides)
+    assert user_version(path) == 0
+
+    assert len(app.test_client().get('/pizzas').json) == 8
+    assert user_version(path) == SCHEMA_VERSION
+
+
+ESQUEMA_V1 = """
+CREATE TABLE pizza (
+    id INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL UNIQUE,
+    description VARCHAR(255) NOT NULL, price FLOAT NOT NULL,
+    image_filename VARCHAR(255), category_id VARCHAR(50));
+CREATE TABLE user (
+    id INTEGER PRIMARY KEY, name VARCHAR(100) NOT NULL,
+    email VARCHAR(120) NOT NULL UNIQUE, password_hash VARCHAR(256) NOT NULL);
+CREATE TABLE cart_item (
+    id INTEGER PRIMARY KEY, quantity INTEGER NOT NULL,
+    user_id INTEGER NOT NULL REFERENCES user (id),
+    pizza_id INTEGER NOT NULL REFERENCES pizza (id));
+INSERT INTO pizza VALUES (1, 'Margherita', 'Molho', 45.9, NULL, 'tradicionais');
+INSERT INTO pizza VALUES (2, 'Calabresa', 'Calabresa', 48.9, NULL, 'tradicionais');
+INSERT INTO user VALUES (1, 'Maria', 'maria@email.com', 'x');
+INSERT INTO cart_item VALUES (1, 2, 1, 2);
+"""
+
+
+@pytest.mark.parametrize('meio_migrado', [False, True])
+def test_migra_precos_para_centavos(tmp_path, meio_migrado):
+    path, overrides = banco(tmp_path)
+    with sqlite3.connect(path) as conn:
+        conn.executescript(ESQUEMA_V1)
+        if meio_migrado:
+            # Estado deixado pela migração antiga quando DROP COLUMN falhava
+            conn.execute("ALTER TABLE pizza ADD COLUMN price_cents INTEGER NOT NULL DEFAULT 0")
+
+    app = create_app('testing', overrides)
+
+    with sqlite3.connect(path) as conn:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(pizza)")]
+        prices = conn.execute("SELECT id, price_cents FROM pizza ORDER BY id").fetchall()
+        fks = conn.execute("PRAGMA foreign_key_list(cart_item)").fetchall()
+    assert 'price' not in columns
+    assert prices == [(1, 4590), (2, 4890)]
+    assert {fk[2] for fk in fks} == {'user', 'pizza'}
+    assert user_version(path) == SCHEMA_VERSION
+
+    with app.app_context():
+        assert app_bella.db.session.get(app_bella.CartItem, 1).pizza.name == 'Calabresa'
+
+
+@pytest.mark.parametrize('cli', ['', 'true'])
+def test_import_nao_carrega_alembic(cli):
+    code = (
+        "import sys, app_bella; app_bella.create_app('testing'); "
+        "print(any(m.split('.')[0] in ('flask_migrate', 'alembic') for m in sys.modules))"
+    )
+    env = dict(os.environ, FLASK_RUN_FROM_CLI=cli)
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == 'False'
@@ -0,0 +1,141 @@
+"""Testes do motor de preços (pricing_bella.py)"""
+
+from datetime import datetime
+
+from pricing_bella import ALL_WEEKDAYS, MINUTES_PER_DAY, PricingEngine, Rule
+
+FRIDAY = 1 << 4
+SEXTA_20H = datetime(2026, 10, 23, 20, 0)  # sexta-feira
+
+
+def regra(id, kind, value, pizza_id=None, category_id=None, combo_size=None,
+          weekdays=ALL_WEEKDAYS, start_minute=0, end_minute=MINUTES_PER_DAY,
+          starts_at=None, ends_at=None):
+    return Rule(id, kind, value, pizza_id, category_id, combo_size,
+                weekdays, start_minute, end_minute, starts_at, ends_at)
+
+
+def motor(pizzas, rules, calls=None):
+    def loader():
+        if calls is not None:
+            calls.append(1)
+        return pizzas, rules
+    return PricingEngine(loader, refresh_seconds=7 * 24 * 3600)
+
+
+def test_combo_desconta_apenas_pizzas_do_combo():
+    engine = motor([(1, 'a', 5000), (2, 'b', 5000)], [
+        regra(1, 'fixed_price', 200, category_id='a'),
+        regra(2, 'combo', 1500, category_id='a', combo_size=2),
+    ])
+    quote = engine.quote([(1, 2), (2, 1)], SEXTA_20H)
+
+    assert quote.subtotal_cents == 5400
+    assert quote.discount_cents == 400
+    assert quote.total_cents == 5000
+
+
+def test_combo_aplica_desconto_por_grupo_completo():
+    engine = motor([(1, 'a', 4000)], [regra(1, 'combo', 1000, combo_size=2)])
+    quote = engine.quote([(1, 5)], SEXTA_20H)
+
+    assert quote.discount_cents == 2000
+    assert quote.total_cents == 18000
+
+
+def test_regras_invalidas_sao_ignoradas():
+    engine = motor([(1, 'a', 1000)], [
+        regra(1, 'bogus', 100),
+        regra(2, 'combo', -500, combo_size=1),
+        regra(3, 'amount_off', -300),
+        regra(4, 'percent', 150),
+        regra(5, 'combo', 100, combo_size=0),
+        regra(6, 'amount_off', 100, start_minute=23 * 60, end_minute=1500),
+        regra(7, 'amount_off', 100, start_minute=-60),
+        regra(8, 'amount_off', 100, weekdays=ALL_WEEKDAYS + 1),
+    ])
+    quote = engine.quote([(1, 2)], SEXTA_20H)
+
+    assert quote.lines[0].unit_price_cents == 1000
+    assert quote.discount_cents == 0
+    assert quote.total_cents == 2000
+
+
+def test_promocoes_unitarias_nao_acumulam_vale_o_menor_preco():
+    engine = motor([(1, 'a', 5000), (2, 'b', 5000)], [
+        regra(1, 'percent', 10),
+        regra(2, 'amount_off', 1000, category_id='a'),
+        regra(3, 'fixed_price', 3000, pizza_id=2),
+    ])
+    table = engine.table(SEXTA_20H)
+
+    # 10% + R$ 10 na pizza 1 daria 3500 se acumulasse
+    assert table.prices == {1: 4000, 2: 3000}
+
+
+def test_combo_aplica_sobre_o_preco_com_promocao():
+    engine = motor([(1, 'a', 5000)], [
+        regra(1, 'percent', 20),
+        regra(2, 'combo', 1000, combo_size=2),
+    ])
+    quote = engine.quote([(1, 2)], SEXTA_20H)
+
+    assert quote.subtotal_cents == 8000
+    assert quote.total_cents == 7000
+
+
+def test_janela_que_atravessa_meia_noite_usa_o_dia_de_inicio():
+    engine = motor([(1, 'a', 5000)], [
+        regra(1, 'amount_off', 500, weekdays=FRIDAY, start_minute=23 * 60, end_minute=60),
+    ])
+
+    def preco(ts):
+        return engine.table(datetime.fromisoformat(ts)).prices[1]
+
+    assert preco('2026-10-23 22:59') == 5000  # sexta, antes da janela
+    assert preco('2026-10-23 23:30') == 4500  # sexta à noite
+    assert preco('2026-10-24 00:30') == 4500  # madrugada de sábado (sexta à noite)
+    assert preco('2026-10-24 01:00') == 5000
+    assert preco('2026-10-23 00:30') == 5000  # madrugada de sexta é quinta à noite
+
+
+def test_virada_de_janela_recompila_sem_recarregar_regras():
+    calls = []
+    engine = motor([(1, 'a', 5000)], [
+        regra(1, 'amount_off', 500, start_minute=18 * 60, end_minute=20 * 60),
+    ], calls)
+
+    antes = engine.table(datetime(2026, 10, 23, 17, 30))
+    assert antes.prices[1] == 5000
+    assert antes.valid_until == datetime(2026, 10, 23, 18, 0)
+
+    durante = engine.table(datetime(2026, 10, 23, 18, 0))
+    assert durante.prices[1] == 4500
+    assert engine.table(datetime(2026, 10, 23, 19, 59)) is durante
+    assert engine.table(datetime(2026, 10, 23, 20, 0)).prices[1] == 5000
+    assert len(calls) == 1
+
+
+def test_invalidate_recarrega_regras():
+    calls = []
+    rules = []
+    engine = motor([(1, 'a', 5000)], rules, calls)
+    assert engine.table(SEXTA_20H).prices[1] == 5000
+
+    rules.append(regra(1, 'percent', 20))
+    assert engine.table(SEXTA_20H).prices[1] == 5000
+
+    engine.invalidate()
+    assert engine.table(SEXTA_20H).prices[1] == 4000
+    assert len(calls) == 2
+
+
+def test_vigencia_por_data():
+    engine = motor([(1, 'a', 5000)], [
+        regra(1, 'percent', 50, starts_at=datetime(2026, 10, 24), ends_at=datetime(2026, 10, 25)),
+    ])
+
+    table = engine.table(SEXTA_20H)
+    assert table.prices[1] == 5000
+    assert table.valid_until == datetime(2026, 10, 24)
+    assert engine.table(datetime(2026, 10, 24, 12, 0)).prices[1] == 2500
@@ -0,0 +1,85 @@
+"""Testes do rate limit integrado à aplicação (429, chave por JWT/IP e /metrics)"""
+
+from datetime import timedelta
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app_bella import User, create_app, db
+
+LIMITES = {'bella.login': '2/minute', 'bella.add_to_cart': '2/minute'}
+
+
+@pytest.fixture
+def app():
+    app = create_app('testing', {'RATELIMIT_ENABLED': True, 'RATELIMITS': LIMITES})
+    with app.app_context():
+        for email in ('a@a', 'b@b'):
+            user = User(name=email, email=email)
+            user.set_password('x')
+            db.session.add(user)
+        db.session.commit()
+    return app
+
+
+def token(app, user_id, **kwargs):
+    with app.app_context():
+        return create_access_token(identity=str(user_id), **kwargs)
+
+
+def login(client, ip):
+    return client.post('/auth/login', data={'username': 'a@a', 'password': 'x'},
+                       environ_base={'REMOTE_ADDR': ip})
+
+
+def add(client, auth, ip='10.0.0.1'):
+    return client.post('/cart/add', data={'pizza_id': 1},
+                       headers={'Authorization': f'Bearer {auth}'},
+                       environ_base={'REMOTE_ADDR': ip})
+
+
+def test_429_com_retry_after_por_ip(app):
+    client = app.test_client()
+
+    assert login(client, '10.0.0.1').status_code == 200
+    assert login(client, '10.0.0.1').status_code == 200
+
+    resp = login(client, '10.0.0.1')
+    assert resp.status_code == 429
+    assert resp.headers['Retry-After'] == '30'
+    assert 'message' in resp.json
+
+    assert login(client, '10.0.0.2').status_code == 200
+
+
+def test_chave_por_usuario_jwt_no_mesmo_ip(app):
+    client = app.test_client()
+    user_a, user_b = token(app, 1), token(app, 2)
+
+    assert add(client, user_a).status_code == 201
+    assert add(client, user_a).status_code == 201
+    assert add(client, user_a).status_code == 429
+    assert add(client, user_b).status_code == 201
+
+
+def test_token_invalido_ou_expirado_usa_o_ip(app):
+    client = app.test_client()
+    expirado = token(app, 1, expires_delta=timedelta(seconds=-1))
+
+    assert add(client, 'malformado').status_code == 422
+    assert add(client, expirado).status_code == 401
+    assert add(client, 'malformado').status_code == 429
+    assert add(client, expirado, ip='10.0.0.2').status_code == 401
+
+    # O usuário válido tem o próprio bucket, mesmo vindo do IP esgotado
+    assert add(client, token(app, 1)).status_code == 201
+
+
+def test_metrics_conta_admitidas_e_recusadas(app):
+    client = app.test_client()
+    for _ in range(3):
+        login(client, '10.0.0.1')
+
+    stats = client.get('/metrics').json['ratelimit']
+    assert stats['bella.login'] == {'allowed': 2, 'limited': 1, 'store_errors': 0}
+    assert stats['bella.add_to_cart'] == {'allowed': 0, 'limited': 0, 'store_errors': 0}
@@ -0,0 +1,60 @@
+"""Testes do rate limit (ratelimit_bella.py)"""
+
+import pytest
+
+from ratelimit_bella import MemoryStore, RateLimiter, StoreError, parse_limit
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 1000.0
+
+    def __call__(self):
+        return self.agora
+
+
+class ArmazenamentoFora:
+    def consume(self, key, capacity, rate, now):
+        raise StoreError("connection refused")
+
+
+def test_parse_limit():
+    assert parse_limit('5/minute') == (5, 5 / 60)
+    with pytest.raises(ValueError):
+        parse_limit('0/minute')
+    with pytest.raises(ValueError):
+        parse_limit('5/week')
+
+
+def test_bucket_recusa_e_recupera_fichas():
+    relogio = Relogio()
+    limiter = RateLimiter({'login': '2/minute'}, MemoryStore(), clock=relogio)
+
+    assert limiter.hit('login', 'ip:1') is None
+    assert limiter.hit('login', 'ip:1') is None
+    assert limiter.hit('login', 'ip:1') == pytest.approx(30)
+    assert limiter.hit('login', 'ip:2') is None
+
+    relogio.agora += 30
+    assert limiter.hit('login', 'ip:1') is None
+    assert limiter.stats()['login'] == {'allowed': 4, 'limited': 1, 'store_errors': 0}
+
+
+def test_memory_store_descarta_o_menos_usado():
+    store = MemoryStore(max_keys=2)
+    store.consume('a', 1, 1, 0)
+    store.consume('b', 1, 1, 0)
+    store.consume('a', 1, 1, 0)
+    store.consume('c', 1, 1, 0)
+
+    assert len(store) == 2
+    assert store.consume('a', 1, 1, 0) > 0  # 'a' continua esgotado
+    assert store.consume('b', 1, 1, 0) == 0  # 'b' foi descartado
+
+
+def test_falha_no_armazenamento_admite_a_requisicao():
+    limiter = RateLimiter({'login': '1/minute'}, ArmazenamentoFora())
+
+    assert limiter.hit('login', 'ip:1') is None
+    assert limiter.hit('login', 'ip:1') is None
+    assert limiter.stats()['login'] == {'allowed': 0, 'limited': 0, 'store_errors': 2}